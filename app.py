@@ -4,29 +4,102 @@ This is the entry point for the Smart Study Companion application.
 It initializes the Flask app and configures all routes and services.
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from dotenv import load_dotenv
+import asyncio
+import atexit
+import json
 import os
-from models.summarizer import TextSummarizer
+from urllib.parse import urlparse
 
-# Load environment variables
+# Load environment variables before importing modules that read them at import time
 load_dotenv()
 
+from models.summarizer import TextSummarizer
+from models.batcher import SummaryBatcher
+
+FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'True') == 'True'
+
+
+class Config:
+    """Application configuration, read from the environment once at startup"""
+    SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key')
+    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///study_companion.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Reject oversized request bodies with 413 before they are read or JSON-decoded.
+    # 128 KiB is about 70 chunks, which the map-reduce pipeline can summarize
+    # well within SUMMARIZE_TIMEOUT; larger texts would only time out.
+    MAX_CONTENT_LENGTH = 128 * 1024
+    # Seconds to wait for a summary; kept below Gunicorn's worker timeout
+    SUMMARIZE_TIMEOUT = 110
+    
+    # Size the connection pool explicitly for server databases; SQLite manages
+    # its own connections and rejects these pool arguments
+    if urlparse(SQLALCHEMY_DATABASE_URI).scheme.split('+')[0] != 'sqlite':
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_timeout': 30,
+            'pool_recycle': 1800,
+            'pool_pre_ping': True
+        }
+
+
 # Initialize Flask app
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///study_companion.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config.from_object(Config)
 
 # Initialize extensions
 CORS(app)
 db = SQLAlchemy(app)
 
+# Create the summarizer once so its LLM client is reused across requests;
+# the batcher coalesces concurrent requests on its own long-lived event loop
+try:
+    app.summarizer = TextSummarizer()
+    app.summary_batcher = SummaryBatcher(app.summarizer)
+    app.summarizer_error = None
+    atexit.register(app.summary_batcher.close)
+except ValueError as e:
+    app.summarizer = None
+    app.summary_batcher = None
+    app.summarizer_error = str(e)
+
 # Import routes (will be created later)
 # from api import auth, study
 
+def parse_summarize_request(data):
+    """Extract and type-check the parameters of a summarize request body
+    
+    Returns:
+        Tuple of (text, max_length, summary_type)
+        
+    Raises:
+        ValueError: If the body or one of its parameters has the wrong type
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Request body must be a JSON object')
+    
+    text = data.get('text', '')
+    max_length = data.get('max_length', 150)
+    summary_type = data.get('summary_type', 'concise')
+    
+    if not isinstance(text, str):
+        raise ValueError('text must be a string')
+    if isinstance(max_length, bool) or not isinstance(max_length, int) or max_length <= 0:
+        raise ValueError('max_length must be a positive integer')
+    if not isinstance(summary_type, str):
+        raise ValueError('summary_type must be a string')
+    
+    return text, max_length, summary_type
+
+@app.errorhandler(413)
+def request_too_large(error):
+    """Return a JSON error for request bodies over MAX_CONTENT_LENGTH"""
+    return jsonify({'error': 'Request body is too large'}), 413
+
 @app.route('/')
 def index():
     """Home page route"""
@@ -41,25 +114,20 @@ def health_check():
     })
 
 @app.route('/api/v1/summarize', methods=['POST'])
-def summarize_text():
+async def summarize_text():
     """Endpoint to summarize text using AI"""
-    data = request.json
-    text = data.get('text', '')
-    
-    
-    if not text or len(text.strip()) == 0:
-        return jsonify({'error': 'Text cannot be empty'}), 400
+    try:
+        text, max_length, summary_type = parse_summarize_request(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    # Get optional parameters
-    max_length = data.get('max_length', 150)
-    summary_type = data.get('summary_type', 'concise')
+    if app.summary_batcher is None:
+        return jsonify({'error': app.summarizer_error}), 503
     
     try:
-        # Initialize summarizer
-        summarizer = TextSummarizer()
-        
         # Perform summarization
-        result = summarizer.summarize(text, max_length=max_length, summary_type=summary_type)
+        future = app.summary_batcher.submit(text, max_length=max_length, summary_type=summary_type)
+        result = await asyncio.wait_for(asyncio.wrap_future(future), app.config['SUMMARIZE_TIMEOUT'])
         
         return jsonify({
             'success': True,
@@ -70,11 +138,42 @@ def summarize_text():
             'word_count': result['word_count']
         })
     
+    except asyncio.TimeoutError:
+        return jsonify({'error': 'Summarization timed out'}), 504
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'Summarization failed: {str(e)}'}), 500
     
+@app.route('/api/v1/summarize/stream', methods=['POST'])
+def summarize_text_stream():
+    """Endpoint to stream a summary as Server-Sent Events
+    
+    Sends one event per piece of the summary, then a final event with
+    the summary statistics once generation completes.
+    """
+    try:
+        text, max_length, summary_type = parse_summarize_request(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if app.summarizer is None:
+        return jsonify({'error': app.summarizer_error}), 503
+    
+    try:
+        events = app.summarizer.summarize_stream(text, max_length=max_length, summary_type=summary_type)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    def generate():
+        try:
+            for event in events:
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
 @app.route('/api/v1/recommendations', methods=['POST'])
 def get_recommendations():
     """Endpoint to get study recommendations"""
@@ -94,5 +193,4 @@ if __name__ == '__main__':
         db.create_all()
     
     # Run the application
-    debug_mode = os.getenv('FLASK_DEBUG', 'True') == 'True'
-    app.run(debug=debug_mode, host='0.0.0.0', port=5000)
+    app.run(debug=FLASK_DEBUG, host='0.0.0.0', port=5000)
@@ -0,0 +1,23 @@
+"""Gunicorn configuration for the Smart Study Companion
+
+Serves the Flask app with a pool of threaded workers so that slow
+summarize requests do not hold up other requests:
+
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Long texts take several OpenAI round trips to summarize
+timeout = 120
+keepalive = 5
+
+# Each worker imports the app itself; the summary batcher's event loop
+# thread would not survive being forked from a preloaded master
+preload_app = False
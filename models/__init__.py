@@ -4,7 +4,6 @@ This package contains AI/ML models for the Smart Study Companion.
 """
 
 from .summarizer import TextSummarizer
-from .recommender import StudyRecommender
-from .chatbot import StudyChatbot
+from .batcher import SummaryBatcher
 
-__all__ = ['TextSummarizer', 'StudyRecommender', 'StudyChatbot']
+__all__ = ['TextSummarizer', 'SummaryBatcher']
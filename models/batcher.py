@@ -0,0 +1,163 @@
+"""Request Batching Module
+
+This module coalesces concurrent summarization requests so that requests
+arriving within a short window are dispatched to OpenAI together.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from typing import Dict
+
+from .summarizer import TextSummarizer
+
+
+class SummaryBatcher:
+    """Collects summarize requests and dispatches them in batches
+
+    Requests are queued on a dedicated event loop running in a background
+    thread. The consumer waits up to ``max_wait_ms`` for a batch to fill,
+    merges identical requests so each distinct input is summarized once,
+    then runs the batch concurrently under a semaphore that caps the number
+    of in-flight OpenAI calls.
+    """
+
+    def __init__(self, summarizer: TextSummarizer, max_batch_size: int = 16,
+                 max_wait_ms: int = 20, max_concurrency: int = 10):
+        """Initialize the SummaryBatcher and start its event loop
+
+        Args:
+            summarizer: TextSummarizer used to serve the requests
+            max_batch_size: Maximum number of requests collected into one batch
+            max_wait_ms: How long to wait for a batch to fill, in milliseconds
+            max_concurrency: Maximum number of concurrent OpenAI calls
+        """
+        self.summarizer = summarizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrency = max_concurrency
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._tasks = set()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    async def _start(self) -> None:
+        """Create the queue and consumer task on the batcher's event loop"""
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._consumer = asyncio.create_task(self._consume())
+
+    def submit(self, text: str, max_length: int = 150,
+               summary_type: str = "concise") -> concurrent.futures.Future:
+        """Queue a summarize request from any thread
+
+        Args:
+            text: The text to summarize
+            max_length: Maximum length of summary in words
+            summary_type: Type of summary ('concise', 'detailed', 'bullet_points')
+
+        Returns:
+            Future resolving to the summarize() result dictionary
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._enqueue((text, max_length, summary_type)), self._loop
+        )
+
+    async def _enqueue(self, request: tuple) -> Dict:
+        """Put a request on the queue and wait for its result"""
+        future = self._loop.create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def _consume(self) -> None:
+        """Drain the queue into batches and dispatch each one"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without waiting so the next batch can start filling
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list) -> None:
+        """Summarize each distinct request in the batch concurrently"""
+        try:
+            waiters = {}
+            for request, future in batch:
+                try:
+                    waiters.setdefault(request, []).append(future)
+                except TypeError as e:
+                    # Unhashable parameters cannot be merged; fail only this request.
+                    # Raise a fresh error so the caller's traceback does not hold
+                    # this coroutine's frame while the rest of the batch runs.
+                    if not future.done():
+                        future.set_exception(TypeError(f'Invalid summarize request: {e}'))
+
+            tasks = []
+            for request, futures in waiters.items():
+                task = asyncio.create_task(self._run(request, futures))
+                for future in futures:
+                    future.add_done_callback(functools.partial(self._cancel_if_abandoned, task, futures))
+                tasks.append(task)
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except Exception as e:
+            # Never leave a caller waiting on a future that will not be resolved
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    @staticmethod
+    def _cancel_if_abandoned(task: asyncio.Task, futures: list, _: asyncio.Future) -> None:
+        """Cancel a request's summarization once every caller waiting on it has given up"""
+        if all(future.cancelled() for future in futures):
+            task.cancel()
+
+    async def _run(self, request: tuple, futures: list) -> None:
+        """Summarize one request and resolve every future waiting on it"""
+        text, max_length, summary_type = request
+        async with self._semaphore:
+            try:
+                result = await self.summarizer.summarize_async(
+                    text, max_length=max_length, summary_type=summary_type
+                )
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for future in futures:
+            if not future.done():
+                future.set_result(result)
+
+    def close(self) -> None:
+        """Cancel pending requests, close the HTTP session and stop the event loop"""
+        if self._loop.is_closed():
+            return
+
+        async def shutdown():
+            # Includes queued requests, so their callers are cancelled rather than left waiting
+            tasks = asyncio.all_tasks() - {asyncio.current_task()}
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.summarizer.aclose()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -4,13 +4,157 @@ This module provides AI-powered text summarization functionality
 using OpenAI's GPT API and Hugging Face transformers.
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import json
 import os
-from typing import Dict, Optional
-import openai
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.chains.summarize import load_summarize_chain
-from langchain.chat_models import ChatOpenAI
-from langchain.docstore.document import Document
+import re
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Union
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+# aiohttp and requests are imported on first use to keep them out of app start-up
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+# Environment-derived defaults, read once at import
+_DEFAULT_API_KEY = os.getenv('OPENAI_API_KEY')
+_DEFAULT_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+_OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', '10'))
+
+_OPENAI_API_BASE = 'https://api.openai.com/v1'
+_SYSTEM_PROMPT = "You are a helpful assistant that creates concise and accurate summaries."
+
+# Prompt templates by summary type, filled with the word budget (n) and the text (t);
+# unknown types use the concise template
+_PROMPT_TEMPLATES = {
+    'concise': "Write a concise summary of about {n} words covering the main points.\n\n{t}",
+    'detailed': "Write a detailed summary of about {n} words with the key details and supporting information.\n\n{t}",
+    'bullet_points': "Summarize the key points in about {n} words as bullet points.\n\n{t}"
+}
+
+# Precompiled patterns used when formatting summaries as bullet points
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+_BULLET_MARKER_RE = re.compile(r'[•-]')
+
+# Texts shorter than this (~1000 tokens at ~3.5 characters per token) are
+# summarized with a single call instead of the chunked map-reduce pipeline
+_SHORT_TEXT_LIMIT = 3500
+
+# Long texts are split into ~2000 character chunks overlapping by 200 characters.
+# Each window prefers to end at a sentence or paragraph boundary and falls back
+# to a hard cut when there is none.
+_CHUNK_SIZE = 2000
+_CHUNK_OVERLAP = 200
+_MAP_CONCURRENCY = 5
+_MIN_CHUNK_SUMMARY_WORDS = 50
+
+# Partial summaries are combined in rounds so that no reduce call is sent more
+# than this many characters (~3500 tokens), however many chunks a text has
+_REDUCE_INPUT_LIMIT = 12000
+_CHUNK_RE = re.compile(
+    rf'.{{1,{_CHUNK_SIZE - _CHUNK_OVERLAP}}}(?:\.\s|\n\n|$)|.{{1,{_CHUNK_SIZE - _CHUNK_OVERLAP}}}',
+    re.S
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session() -> 'requests.Session':
+    """Return the keep-alive session shared by all synchronous OpenAI calls
+    
+    Reusing pooled connections lets repeated calls skip the TCP and TLS
+    handshakes.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+    atexit.register(session.close)
+    return session
+
+
+class _OpenAIError(Exception):
+    """Non-success response returned by the OpenAI REST API"""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(f"OpenAI API error {status}: {message}")
+        self.status = status
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed OpenAI call is worth retrying"""
+    if isinstance(error, _OpenAIError):
+        return error.status == 429 or error.status >= 500
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    
+    # Timeouts and dropped, refused or truncated connections. An HTTP client
+    # that was never imported cannot have raised, so it is not imported here.
+    aiohttp = sys.modules.get('aiohttp')
+    if aiohttp and isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+        return True
+    requests = sys.modules.get('requests')
+    return bool(requests) and isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+# Retry rate limits, server errors and connection failures with jittered exponential backoff
+_retry_transient = retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception(_is_transient),
+    reraise=True
+)
+
+# Caps in-flight OpenAI requests across every thread and event loop in the
+# process (each worker process has its own cap)
+_OPENAI_SLOTS = threading.BoundedSemaphore(_OPENAI_MAX_CONCURRENCY)
+
+
+@contextlib.asynccontextmanager
+async def _openai_slot():
+    """Hold one of the process-wide OpenAI request slots without blocking the event loop"""
+    # A threading semaphore cannot wake a coroutine, so wait by polling. Waiting
+    # in an executor thread instead could take a slot after the caller was
+    # cancelled and never give it back. The cost is only paid once the cap is
+    # reached: up to 50 ms extra per call. Threads blocked in acquire() may also
+    # take a freed slot before a polling coroutine does.
+    while not _OPENAI_SLOTS.acquire(blocking=False):
+        await asyncio.sleep(0.05)
+    try:
+        yield
+    finally:
+        _OPENAI_SLOTS.release()
+
+
+class _RateLimiter:
+    """Token bucket allowing at most ``rpm`` acquisitions per minute"""
+    
+    def __init__(self, rpm: int):
+        self.capacity = rpm
+        self.tokens = float(rpm)
+        self.rate = rpm / 60
+        self.updated = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
 
 
 class TextSummarizer:
@@ -20,20 +164,28 @@ class TextSummarizer:
     with support for long documents through chunking and chaining.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None,
+                 cache_size: int = 1024):
         """Initialize the TextSummarizer
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
-            model: OpenAI model to use (default: gpt-3.5-turbo)
+            model: OpenAI model to use (defaults to OPENAI_MODEL env var or gpt-3.5-turbo)
+            cache_size: Number of recent summaries to memoize (0 disables caching)
         """
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.api_key = api_key or _DEFAULT_API_KEY
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        openai.api_key = self.api_key
-        self.model = model
-        self.llm = ChatOpenAI(temperature=0, model_name=model, openai_api_key=self.api_key)
+        self.model = model or _DEFAULT_MODEL
+        
+        # LRU cache of results keyed by (text hash, max_length, summary_type)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # aiohttp sessions are bound to an event loop, so keep one per loop
+        self._sessions = weakref.WeakKeyDictionary()
         
     def summarize(self, text: str, max_length: int = 150, summary_type: str = "concise") -> Dict:
         """Summarize the given text
@@ -49,118 +201,622 @@ class TextSummarizer:
                 - original_length: Character count of original text
                 - summary_length: Character count of summary
                 - compression_ratio: Ratio of summary to original length
+                
+        Raises:
+            ValueError: If text is empty or only whitespace
         """
-        if not text or len(text.strip()) == 0:
-            raise ValueError("Text cannot be empty")
+        self._validate_text(text)
+        
+        cache_key = self._cache_key(text, max_length, summary_type)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            # For short texts (< 1000 chars), use direct API call
-            if len(text) < 1000:
+            # Texts that fit comfortably in one request are summarized directly
+            if len(text) < _SHORT_TEXT_LIMIT:
                 summary = self._summarize_short(text, summary_type, max_length)
             else:
-                # For long texts, use LangChain with chunking
+                # For long texts, summarize chunks and combine the results
                 summary = self._summarize_long(text, summary_type, max_length)
+        except Exception as e:
+            raise self._translate_error(e) from e
+        
+        result = self._build_result(text, summary)
+        self._cache_put(cache_key, result)
+        return result
+    
+    async def summarize_async(self, text: str, max_length: int = 150, summary_type: str = "concise") -> Dict:
+        """Asynchronous counterpart of summarize()
+        
+        Requests are sent straight to the OpenAI REST API over a shared
+        aiohttp session, so the event loop is never blocked.
+        
+        Args:
+            text: The text to summarize
+            max_length: Maximum length of summary in words
+            summary_type: Type of summary ('concise', 'detailed', 'bullet_points')
             
-            return {
-                'summary': summary,
-                'original_length': len(text),
-                'summary_length': len(summary),
-                'compression_ratio': round(len(summary) / len(text), 2),
-                'word_count': len(summary.split())
-            }
+        Returns:
+            Dictionary with the same keys as summarize()
+        """
+        self._validate_text(text)
+        
+        cache_key = self._cache_key(text, max_length, summary_type)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            if len(text) < _SHORT_TEXT_LIMIT:
+                summary = await self._summarize_short_async(text, summary_type, max_length)
+            else:
+                summary = await self._summarize_long_async(text, summary_type, max_length)
+        except Exception as e:
+            raise self._translate_error(e) from e
+        
+        result = self._build_result(text, summary)
+        self._cache_put(cache_key, result)
+        return result
+    
+    def summarize_stream(self, text: str, max_length: int = 150,
+                         summary_type: str = "concise") -> Iterator[Dict]:
+        """Summarize the given text, yielding the summary as it is generated
+        
+        Args:
+            text: The text to summarize
+            max_length: Maximum length of summary in words
+            summary_type: Type of summary ('concise', 'detailed', 'bullet_points')
             
-        except openai.error.AuthenticationError:
-            raise ValueError("Invalid OpenAI API key")
-        except openai.error.RateLimitError:
-            raise ValueError("OpenAI API rate limit exceeded. Please try again later.")
+        Returns:
+            Iterator of {'delta': str} events carrying pieces of the summary,
+            followed by one event with the same keys as summarize() plus
+            'done': True
+        """
+        self._validate_text(text)
+        
+        return self._stream_events(text, max_length, summary_type)
+    
+    def _stream_events(self, text: str, max_length: int, summary_type: str) -> Iterator[Dict]:
+        """Generate the events for summarize_stream()"""
+        cache_key = self._cache_key(text, max_length, summary_type)
+        result = self._cache_get(cache_key)
+        if result is not None:
+            yield {'delta': result['summary']}
+            yield {'done': True, **result}
+            return
+        
+        try:
+            if len(text) < _SHORT_TEXT_LIMIT:
+                parts = []
+                for delta in self._summarize_short(text, summary_type, max_length, stream=True):
+                    if delta:
+                        parts.append(delta)
+                        yield {'delta': delta}
+                summary = ''.join(parts).strip()
+            else:
+                # The chunked pipeline only produces the finished summary
+                summary = self._summarize_long(text, summary_type, max_length)
+                yield {'delta': summary}
         except Exception as e:
-            raise Exception(f"Summarization failed: {str(e)}")
+            raise self._translate_error(e) from e
+        
+        result = self._build_result(text, summary)
+        self._cache_put(cache_key, result)
+        yield {'done': True, **result}
+    
+    @staticmethod
+    def _validate_text(text: str) -> None:
+        """Raise ValueError if text has nothing to summarize"""
+        if not text or text.isspace():
+            raise ValueError("Text cannot be empty")
+    
+    @staticmethod
+    def _build_result(text: str, summary: str) -> Dict:
+        """Build the result dictionary returned by summarize()"""
+        original_length = len(text)
+        summary_length = len(summary)
+        return {
+            'summary': summary,
+            'original_length': original_length,
+            'summary_length': summary_length,
+            'compression_ratio': round(summary_length / original_length, 2),
+            'word_count': len(summary.split())
+        }
+    
+    @staticmethod
+    def _translate_error(error: Exception) -> Exception:
+        """Map an OpenAI failure onto the exception surfaced to callers"""
+        status = getattr(error, 'status', None)
+        if status == 401:
+            return ValueError("Invalid OpenAI API key")
+        if status == 429:
+            return ValueError("OpenAI API rate limit exceeded. Please try again later.")
+        return Exception(f"Summarization failed: {str(error)}")
+    
+    @staticmethod
+    def _cache_key(text: str, max_length: int, summary_type: str) -> tuple:
+        """Build a cache key from a digest of the text rather than the text itself"""
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        return (digest, max_length, summary_type)
+    
+    def _cache_get(self, key: tuple) -> Optional[Dict]:
+        """Return a copy of a cached result, marking it as recently used"""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+            return dict(result)
     
-    def _summarize_short(self, text: str, summary_type: str, max_length: int) -> str:
-        """Summarize short text using direct OpenAI API call"""
+    def _cache_put(self, key: tuple, result: Dict) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = dict(result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _summarize_short(self, text: str, summary_type: str, max_length: int,
+                         stream: bool = False) -> Union[str, Iterator[str]]:
+        """Summarize short text using direct OpenAI API call
+        
+        With stream=True, returns an iterator over pieces of the summary as
+        the model generates them instead of the finished summary.
+        """
         prompt = self._build_prompt(text, summary_type, max_length)
         
-        response = openai.ChatCompletion.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that creates concise and accurate summaries."},
-                {"role": "user", "content": prompt}
+        return self._chat_completion(prompt, max_tokens=max_length * 2, stream=stream)
+    
+    @_retry_transient
+    def _chat_completion(self, prompt: str, max_tokens: int,
+                         stream: bool = False) -> Union[str, Iterator[str]]:
+        """POST a chat completion request over the shared keep-alive session
+        
+        With stream=True, returns an iterator over the content deltas.
+        """
+        payload = self._build_payload(prompt, max_tokens)
+        payload['stream'] = stream
+        headers = {'Authorization': f'Bearer {self.api_key}'}
+        
+        _OPENAI_SLOTS.acquire()
+        try:
+            response = _http_session().post(f'{_OPENAI_API_BASE}/chat/completions', json=payload,
+                                            headers=headers, timeout=60, stream=stream)
+            if stream:
+                if response.status_code != 200:
+                    raise _OpenAIError(response.status_code, response.text)
+                # The delta iterator now owns the slot and releases it when the
+                # stream ends or is closed; advance it into its try block so that
+                # closing it early still runs the release
+                deltas = self._iter_stream_deltas(response)
+                next(deltas)
+                return deltas
+        except BaseException:
+            _OPENAI_SLOTS.release()
+            raise
+        
+        try:
+            return self._check_response(response)['choices'][0]['message']['content'].strip()
+        finally:
+            _OPENAI_SLOTS.release()
+    
+    @staticmethod
+    def _iter_stream_deltas(response) -> Iterator[str]:
+        """Yield the content deltas of a streamed (Server-Sent Events) completion
+        
+        The first next() yields nothing; the caller makes it to start the
+        iterator. The OpenAI request slot held for the response is released
+        when the iterator finishes or is closed.
+        """
+        try:
+            yield
+            with response:
+                for line in response.iter_lines():
+                    if not line.startswith(b'data: '):
+                        continue
+                    data = line[len(b'data: '):]
+                    if data == b'[DONE]':
+                        break
+                    choices = json.loads(data).get('choices')
+                    if choices:
+                        yield choices[0]['delta'].get('content') or ''
+        finally:
+            _OPENAI_SLOTS.release()
+    
+    async def _summarize_short_async(self, text: str, summary_type: str, max_length: int) -> str:
+        """Summarize short text with a direct async call to the OpenAI REST API"""
+        prompt = self._build_prompt(text, summary_type, max_length)
+        return await self._chat_completion_async(prompt, max_tokens=max_length * 2)
+    
+    @_retry_transient
+    async def _chat_completion_async(self, prompt: str, max_tokens: int) -> str:
+        """POST a chat completion request and return the message content"""
+        payload = self._build_payload(prompt, max_tokens)
+        headers = {'Authorization': f'Bearer {self.api_key}'}
+        
+        session = self._get_session()
+        async with _openai_slot():
+            async with session.post(f'{_OPENAI_API_BASE}/chat/completions', json=payload, headers=headers) as response:
+                if response.status != 200:
+                    raise _OpenAIError(response.status, await response.text())
+                body = await response.json()
+        
+        return body['choices'][0]['message']['content'].strip()
+    
+    def _build_payload(self, prompt: str, max_tokens: int) -> Dict:
+        """Build the request body for a chat completion call"""
+        return {
+            'model': self.model,
+            'messages': [
+                {'role': 'system', 'content': _SYSTEM_PROMPT},
+                {'role': 'user', 'content': prompt}
             ],
-            max_tokens=max_length * 2,  # Approximate tokens
-            temperature=0.3
-        )
+            'max_tokens': max_tokens,
+            'temperature': 0.3
+        }
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Return the HTTP session for the running event loop, creating it on first use"""
+        import aiohttp
         
-        return response.choices[0].message['content'].strip()
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+            self._sessions[loop] = session
+        return session
+    
+    async def aclose(self) -> None:
+        """Close the HTTP session owned by the running event loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
     
     def _summarize_long(self, text: str, summary_type: str, max_length: int) -> str:
-        """Summarize long text using LangChain with chunking"""
-        # Split text into chunks
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=2000,
-            chunk_overlap=200
-        )
+        """Summarize long text by summarizing chunks and combining the results"""
+        return self._run_sync(self._summarize_long_async(text, summary_type, max_length))
+    
+    async def _summarize_long_async(self, text: str, summary_type: str, max_length: int) -> str:
+        """Map-reduce summarization with the chunk summaries requested concurrently"""
+        chunks = self._fast_split(text)
+        chunk_length = max(max_length // len(chunks), _MIN_CHUNK_SUMMARY_WORDS)
+        semaphore = asyncio.Semaphore(_MAP_CONCURRENCY)
         
-        # Create documents
-        chunks = text_splitter.split_text(text)
-        docs = [Document(page_content=chunk) for chunk in chunks]
+        async def summarize_chunk(chunk):
+            async with semaphore:
+                prompt = self._build_prompt(chunk, summary_type, chunk_length)
+                return await self._chat_completion_async(prompt, max_tokens=chunk_length * 2)
         
-        # Use map_reduce chain for summarization
-        chain = load_summarize_chain(
-            self.llm,
-            chain_type="map_reduce",
-            verbose=False
-        )
+        # Map: summarize every chunk at once
+        partials = await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks))
         
-        summary = chain.run(docs)
+        # Reduce: combine groups of partial summaries until they fit in one call
+        while len(partials) > 1 and len('\n\n'.join(partials)) > _REDUCE_INPUT_LIMIT:
+            groups = self._group_partials(partials)
+            partials = await asyncio.gather(*(summarize_chunk('\n\n'.join(group)) for group in groups))
+        prompt = self._build_prompt('\n\n'.join(partials), summary_type, max_length)
+        summary = await self._chat_completion_async(prompt, max_tokens=max_length * 2)
         
         # Apply summary type formatting
-        if summary_type == "bullet_points":
-            summary = self._format_as_bullets(summary)
+        postprocess = _POSTPROCESS.get(summary_type)
+        return postprocess(self, summary) if postprocess else summary
+    
+    @staticmethod
+    def _fast_split(text: str) -> list:
+        """Split text into overlapping chunks in a single regex pass
+        
+        Each chunk is prefixed with the tail of the previous one so that
+        context spanning a chunk boundary is not lost.
+        """
+        chunks = []
+        previous = ''
+        for match in _CHUNK_RE.finditer(text):
+            chunk = match.group()
+            if chunk.strip():
+                chunks.append(previous[-_CHUNK_OVERLAP:] + chunk)
+            previous = chunk
+        return chunks
+    
+    @staticmethod
+    def _group_partials(partials: list) -> list:
+        """Group consecutive partial summaries for one reduce round
         
-        return summary
+        Groups are filled up to _REDUCE_INPUT_LIMIT characters but always hold
+        at least two partials, so every round shrinks the number of partials.
+        """
+        groups = []
+        group, size = [], 0
+        for partial in partials:
+            if len(group) >= 2 and size + len(partial) > _REDUCE_INPUT_LIMIT:
+                groups.append(group)
+                group, size = [], 0
+            group.append(partial)
+            size += len(partial) + 2
+        if len(group) == 1 and groups:
+            groups[-1].append(group[0])
+        else:
+            groups.append(group)
+        return groups
     
     def _build_prompt(self, text: str, summary_type: str, max_length: int) -> str:
         """Build the summarization prompt based on type"""
-        base_prompt = f"Please summarize the following text in approximately {max_length} words."
-        
-        if summary_type == "concise":
-            instruction = "Provide a concise summary capturing the main points."
-        elif summary_type == "detailed":
-            instruction = "Provide a detailed summary including key details and supporting information."
-        elif summary_type == "bullet_points":
-            instruction = "Provide a summary in bullet point format, highlighting key points."
-        else:
-            instruction = "Provide a clear summary."
-        
-        return f"{base_prompt}\n{instruction}\n\nText:\n{text}\n\nSummary:"
+        template = _PROMPT_TEMPLATES.get(summary_type, _PROMPT_TEMPLATES['concise'])
+        return template.format(n=max_length, t=text)
     
     def _format_as_bullets(self, text: str) -> str:
         """Format text as bullet points if not already formatted"""
-        if '•' in text or '-' in text:
+        if _BULLET_MARKER_RE.search(text):
             return text
         
-        sentences = text.split('. ')
-        bullets = ['• ' + sent.strip() + ('.' if not sent.endswith('.') else '') for sent in sentences if sent.strip()]
-        return '\n'.join(bullets)
+        return '\n'.join(
+            '• ' + sentence.rstrip() + ('' if sentence.endswith(('.', '!', '?')) else '.')
+            for sentence in _SENTENCE_BOUNDARY_RE.split(text.strip())
+            if sentence
+        )
     
-    def batch_summarize(self, texts: list, **kwargs) -> list:
+    def batch_summarize(self, texts: list, use_batch_api: bool = False,
+                        batch_timeout: Optional[float] = None, **kwargs) -> list:
         """Summarize multiple texts in batch
         
+        By default this is a synchronous wrapper around batch_summarize_async().
+        With use_batch_api, short texts are submitted as one OpenAI Batch API
+        job instead, which is cheaper but may take hours to complete.
+        
         Args:
             texts: List of texts to summarize
-            **kwargs: Additional arguments passed to summarize()
+            use_batch_api: Submit short texts through the OpenAI Batch API
+            batch_timeout: Seconds to wait for a Batch API job before cancelling
+                it and falling back to concurrent calls (None waits for the job)
+            **kwargs: Additional arguments passed to batch_summarize_async()
             
         Returns:
             List of summary dictionaries
         """
-        summaries = []
-        for text in texts:
+        if use_batch_api:
+            return self._batch_summarize_with_batch_api(texts, batch_timeout, **kwargs)
+        return self._run_sync(self.batch_summarize_async(texts, **kwargs))
+    
+    def _batch_summarize_with_batch_api(self, texts: list, timeout: Optional[float],
+                                        max_length: int = 150, summary_type: str = "concise",
+                                        **kwargs) -> list:
+        """Summarize texts through the OpenAI Batch API
+        
+        Long texts need the chunked pipeline, so they are summarized through
+        the concurrent path, as is everything if the job fails or exceeds
+        timeout.
+        """
+        results = [None] * len(texts)
+        batched = []
+        for index, text in enumerate(texts):
+            try:
+                self._validate_text(text)
+            except ValueError as e:
+                results[index] = self._batch_error(text, e)
+                continue
+            
+            if len(text) < _SHORT_TEXT_LIMIT:
+                results[index] = self._cache_get(self._cache_key(text, max_length, summary_type))
+                if results[index] is None:
+                    batched.append(index)
+        
+        if batched:
+            prompts = [self._build_prompt(texts[index], summary_type, max_length) for index in batched]
             try:
-                summary = self.summarize(text, **kwargs)
-                summaries.append(summary)
-            except Exception as e:
-                summaries.append({
-                    'error': str(e),
-                    'original_text': text[:100] + '...' if len(text) > 100 else text
-                })
-        return summaries
+                outputs = self._submit_openai_batch(prompts, max_tokens=max_length * 2, timeout=timeout)
+            except Exception:
+                # Timed out, failed, expired or cancelled jobs are retried
+                # through the concurrent path
+                outputs = [None] * len(batched)
+            
+            for index, output in zip(batched, outputs):
+                if isinstance(output, Exception):
+                    results[index] = self._batch_error(texts[index], self._translate_error(output))
+                elif output is not None:
+                    results[index] = self._build_result(texts[index], output)
+                    self._cache_put(self._cache_key(texts[index], max_length, summary_type), results[index])
+        
+        remaining = [index for index, result in enumerate(results) if result is None]
+        if remaining:
+            fallback = self.batch_summarize(
+                [texts[index] for index in remaining],
+                max_length=max_length, summary_type=summary_type, **kwargs
+            )
+            for index, result in zip(remaining, fallback):
+                results[index] = result
+        
+        return results
+    
+    def _submit_openai_batch(self, prompts: list, max_tokens: int,
+                             timeout: Optional[float] = None) -> list:
+        """Run prompts as an OpenAI Batch API job and collect the results
+        
+        Args:
+            prompts: Prompts to send, one chat completion each
+            max_tokens: Completion token limit for each prompt
+            timeout: Seconds to wait before cancelling the job (None waits
+                until the job's 24h completion window closes)
+            
+        Returns:
+            List with the summary text, an exception, or None if the prompt
+            should be retried outside the job, for each prompt
+            
+        Raises:
+            TimeoutError: If the job did not finish within timeout
+            Exception: If the job could not be submitted, polled or read, or
+                did not complete; a job still running is cancelled first
+        """
+        http = _http_session()
+        headers = {'Authorization': f'Bearer {self.api_key}'}
+        requests_jsonl = '\n'.join(
+            json.dumps({
+                'custom_id': str(index),
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._build_payload(prompt, max_tokens)
+            })
+            for index, prompt in enumerate(prompts)
+        )
+        
+        uploaded = self._check_response(http.post(
+            f'{_OPENAI_API_BASE}/files',
+            headers=headers,
+            data={'purpose': 'batch'},
+            files={'file': ('batch.jsonl', requests_jsonl.encode('utf-8'))},
+            timeout=60
+        ))
+        batch = self._check_response(http.post(
+            f'{_OPENAI_API_BASE}/batches',
+            headers=headers,
+            json={
+                'input_file_id': uploaded['id'],
+                'endpoint': '/v1/chat/completions',
+                'completion_window': '24h'
+            },
+            timeout=60
+        ))
+        
+        try:
+            batch = self._wait_for_openai_batch(batch, timeout)
+        except Exception:
+            # Stop the job server-side rather than leave it running and billing
+            try:
+                http.post(f'{_OPENAI_API_BASE}/batches/{batch["id"]}/cancel', headers=headers, timeout=60)
+            except Exception:
+                pass
+            raise
+        
+        if batch['status'] != 'completed':
+            raise _OpenAIError(500, f"OpenAI batch {batch['id']} ended with status {batch['status']}")
+        return self._collect_openai_batch(batch, len(prompts))
+    
+    def _wait_for_openai_batch(self, batch: Dict, timeout: Optional[float]) -> Dict:
+        """Poll a batch with exponential backoff until it reaches a terminal state
+        
+        Raises:
+            TimeoutError: If the job did not finish within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 5
+        while batch['status'] not in ('completed', 'failed', 'expired', 'cancelled'):
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"OpenAI batch {batch['id']} did not finish within {timeout} seconds")
+            time.sleep(delay)
+            delay = min(delay * 2, 60)
+            batch = self._openai_get(f'/batches/{batch["id"]}').json()
+        return batch
+    
+    def _collect_openai_batch(self, batch: Dict, count: int) -> list:
+        """Read a completed batch's output and error files into per-prompt results
+        
+        Prompts with no result or a transient error are left as None.
+        """
+        results = [None] * count
+        for file_key in ('output_file_id', 'error_file_id'):
+            if not batch.get(file_key):
+                continue
+            content = self._openai_get(f'/files/{batch[file_key]}/content')
+            
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get('response') or {}
+                status = response.get('status_code', 500)
+                if status == 200:
+                    output = response['body']['choices'][0]['message']['content'].strip()
+                else:
+                    error = record.get('error') or response.get('body', {}).get('error') or {}
+                    output = _OpenAIError(status, error.get('message', 'Batch request failed'))
+                    if _is_transient(output):
+                        output = None
+                results[int(record['custom_id'])] = output
+        
+        return results
+    
+    @_retry_transient
+    def _openai_get(self, path: str) -> 'requests.Response':
+        """GET an OpenAI REST resource, retrying transient failures"""
+        response = _http_session().get(
+            f'{_OPENAI_API_BASE}{path}',
+            headers={'Authorization': f'Bearer {self.api_key}'},
+            timeout=60
+        )
+        if response.status_code != 200:
+            raise _OpenAIError(response.status_code, response.text)
+        return response
+    
+    @staticmethod
+    def _check_response(response) -> Dict:
+        """Return the JSON body of a successful OpenAI response or raise _OpenAIError"""
+        if response.status_code != 200:
+            raise _OpenAIError(response.status_code, response.text)
+        return response.json()
+    
+    async def batch_summarize_async(self, texts: list, max_concurrency: int = 10,
+                                    rpm: int = 60, **kwargs) -> list:
+        """Summarize multiple texts concurrently
+        
+        Args:
+            texts: List of texts to summarize
+            max_concurrency: Maximum number of summaries in flight at once
+            rpm: Maximum number of summaries started per minute
+            **kwargs: Additional arguments passed to summarize_async()
+            
+        Returns:
+            List of summary dictionaries, in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = _RateLimiter(rpm)
+        
+        async def summarize_one(text):
+            async with semaphore:
+                await limiter.acquire()
+                return await self.summarize_async(text, **kwargs)
+        
+        results = await asyncio.gather(*(summarize_one(text) for text in texts), return_exceptions=True)
+        
+        return [
+            self._batch_error(text, result) if isinstance(result, Exception) else result
+            for text, result in zip(texts, results)
+        ]
+    
+    @staticmethod
+    def _batch_error(text: str, error: Exception) -> Dict:
+        """Build the entry reported for a text that failed in a batch"""
+        return {
+            'error': str(error),
+            'original_text': text[:100] + '...' if len(text) > 100 else text
+        }
+    
+    def _run_sync(self, coro):
+        """Run a coroutine to completion on a fresh event loop
+        
+        The HTTP session created for that loop is closed before returning.
+        Called from a thread that is already running an event loop, the
+        coroutine runs on a helper thread, since event loops cannot nest.
+        """
+        async def run():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, run()).result()
+
+
+# Formatting applied to long-text summaries, by summary type
+_POSTPROCESS = {
+    'bullet_points': TextSummarizer._format_as_bullets
+}
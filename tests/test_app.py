@@ -0,0 +1,147 @@
+"""Unit tests for the Flask API routes"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+import os
+import sys
+
+# Add parent directory to path to import app
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# The summarizer is created when app is imported, so give it a key first
+with patch('models.summarizer._DEFAULT_API_KEY', 'test-key'):
+    from app import app, parse_summarize_request
+
+
+def stream_response(*deltas):
+    """Build a mock streamed chat completion HTTP response yielding deltas"""
+    response = MagicMock(status_code=200)
+    response.iter_lines.return_value = [
+        b'data: ' + json.dumps({'choices': [{'delta': {'content': delta}}]}).encode('utf-8')
+        for delta in deltas
+    ] + [b'data: [DONE]']
+    return response
+
+
+def parse_events(body):
+    """Split a Server-Sent Events body into its decoded JSON events"""
+    frames = body.split('\n\n')
+    assert frames[-1] == '', 'events must end with a blank line'
+    return [json.loads(frame[len('data: '):]) for frame in frames[:-1]]
+
+
+class TestParseSummarizeRequest(unittest.TestCase):
+    """Test cases for parse_summarize_request()"""
+
+    def test_defaults(self):
+        """Test that omitted parameters take their defaults"""
+        self.assertEqual(parse_summarize_request({'text': 'Notes.'}), ('Notes.', 150, 'concise'))
+
+    def test_rejects_wrong_types(self):
+        """Test that bodies and parameters of the wrong type raise ValueError"""
+        for data in (None, ['text'], {'text': 42}, {'text': 'Notes.', 'max_length': '150'},
+                     {'text': 'Notes.', 'max_length': True}, {'text': 'Notes.', 'max_length': 0},
+                     {'text': 'Notes.', 'max_length': [1]}, {'text': 'Notes.', 'summary_type': ['concise']}):
+            with self.assertRaises(ValueError, msg=data):
+                parse_summarize_request(data)
+
+
+class TestSummarizeRoute(unittest.TestCase):
+    """Test cases for the /api/v1/summarize endpoint"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_returns_summary(self, mock_completion):
+        """Test that a valid request returns the summary and its statistics"""
+        mock_completion.return_value = 'Short summary.'
+
+        response = self.client.post('/api/v1/summarize', json={'text': 'Text for the summarize route.'})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertTrue(body['success'])
+        self.assertEqual(body['summary'], 'Short summary.')
+        self.assertEqual(body['word_count'], 2)
+
+    def test_summarize_invalid_parameters_return_400(self):
+        """Test that malformed bodies are rejected without reaching the batcher"""
+        for data in ({'text': 42}, {'text': 'Notes.', 'max_length': 'long'}, {'text': '   '}):
+            response = self.client.post('/api/v1/summarize', json=data)
+            self.assertEqual(response.status_code, 400, data)
+            self.assertIn('error', response.get_json())
+
+        response = self.client.post('/api/v1/summarize', data='not json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_summarize_oversized_body_returns_json_413(self):
+        """Test that bodies over MAX_CONTENT_LENGTH get a JSON error"""
+        text = 'x' * app.config['MAX_CONTENT_LENGTH']
+
+        response = self.client.post('/api/v1/summarize', json={'text': text})
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.get_json(), {'error': 'Request body is too large'})
+
+    @patch.dict(app.config, {'SUMMARIZE_TIMEOUT': 0.05})
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_timeout_returns_504(self, mock_completion):
+        """Test that a summary that takes too long is answered with 504"""
+        async def slow(prompt, max_tokens):
+            await asyncio.sleep(5)
+        mock_completion.side_effect = slow
+
+        response = self.client.post('/api/v1/summarize', json={'text': 'Text that takes too long.'})
+
+        self.assertEqual(response.status_code, 504)
+        self.assertEqual(response.get_json(), {'error': 'Summarization timed out'})
+
+
+class TestSummarizeStreamRoute(unittest.TestCase):
+    """Test cases for the /api/v1/summarize/stream endpoint"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+
+    @patch('requests.Session.post')
+    def test_stream_sends_deltas_then_statistics(self, mock_post):
+        """Test that the summary is streamed as data events ending with statistics"""
+        mock_post.return_value = stream_response('Streamed ', 'summary.')
+
+        response = self.client.post('/api/v1/summarize/stream', json={'text': 'Text to stream.'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        events = parse_events(response.get_data(as_text=True))
+        self.assertEqual(events[:2], [{'delta': 'Streamed '}, {'delta': 'summary.'}])
+        self.assertTrue(events[-1]['done'])
+        self.assertEqual(events[-1]['summary'], 'Streamed summary.')
+        self.assertEqual(events[-1]['word_count'], 2)
+
+    @patch('requests.Session.post')
+    def test_stream_failure_sends_error_event(self, mock_post):
+        """Test that a failure after the stream starts ends it with an error event"""
+        mock_post.return_value = MagicMock(status_code=401, text='Incorrect API key provided')
+
+        response = self.client.post('/api/v1/summarize/stream', json={'text': 'Text that fails.'})
+
+        self.assertEqual(response.status_code, 200)
+        events = parse_events(response.get_data(as_text=True))
+        self.assertEqual(len(events), 1)
+        self.assertIn('Invalid OpenAI API key', events[0]['error'])
+
+    def test_stream_empty_text_returns_400(self):
+        """Test that empty text is rejected before the stream starts"""
+        response = self.client.post('/api/v1/summarize/stream', json={'text': '   '})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Text cannot be empty')
+
+
+if __name__ == '__main__':
+    unittest.main()
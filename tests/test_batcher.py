@@ -0,0 +1,147 @@
+"""Unit tests for SummaryBatcher class"""
+
+import asyncio
+import concurrent.futures
+import unittest
+from unittest.mock import MagicMock
+import os
+import sys
+import threading
+
+# Add parent directory to path to import models
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.batcher import SummaryBatcher
+
+
+class TestSummaryBatcher(unittest.TestCase):
+    """Test cases for SummaryBatcher class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.summarizer = MagicMock()
+        self.calls = []
+
+        async def summarize_async(text, max_length=150, summary_type='concise'):
+            self.calls.append((text, max_length, summary_type))
+            if not text:
+                raise ValueError('Text cannot be empty')
+            return {'summary': f'Summary of {text}'}
+
+        async def aclose():
+            pass
+
+        self.summarizer.summarize_async = summarize_async
+        self.summarizer.aclose = aclose
+        self.batcher = SummaryBatcher(self.summarizer, max_wait_ms=50)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.batcher.close()
+
+    def test_submit_returns_summary(self):
+        """Test that a submitted request resolves to the summarizer result"""
+        result = self.batcher.submit('Some text').result(timeout=5)
+
+        self.assertEqual(result['summary'], 'Summary of Some text')
+        self.assertEqual(self.calls, [('Some text', 150, 'concise')])
+
+    def test_submit_propagates_errors(self):
+        """Test that summarizer errors are raised from the future"""
+        future = self.batcher.submit('')
+
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+
+    def test_unhashable_request_fails_without_blocking_batch(self):
+        """Test that a malformed request does not strand others in its batch"""
+        bad = self.batcher.submit('Some text', max_length=[1])
+        good = self.batcher.submit('Other text')
+
+        with self.assertRaises(TypeError):
+            bad.result(timeout=5)
+        self.assertEqual(good.result(timeout=5)['summary'], 'Summary of Other text')
+
+    def test_abandoned_request_is_cancelled(self):
+        """Test that summarization stops once its only caller gives up"""
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def summarize_async(text, max_length=150, summary_type='concise'):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        self.summarizer.summarize_async = summarize_async
+        future = self.batcher.submit('Slow text')
+        self.assertTrue(started.wait(5))
+        future.cancel()
+
+        self.assertTrue(cancelled.wait(5))
+
+    def test_request_with_remaining_waiter_is_not_cancelled(self):
+        """Test that a coalesced request keeps running while a caller still waits"""
+        release = threading.Event()
+
+        async def summarize_async(text, max_length=150, summary_type='concise'):
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+            return {'summary': f'Summary of {text}'}
+
+        self.summarizer.summarize_async = summarize_async
+        first = self.batcher.submit('Same text')
+        second = self.batcher.submit('Same text')
+        first.cancel()
+        release.set()
+
+        self.assertEqual(second.result(timeout=5)['summary'], 'Summary of Same text')
+
+    def test_close_cancels_pending_requests(self):
+        """Test that closing the batcher does not leave callers waiting"""
+        async def summarize_async(text, max_length=150, summary_type='concise'):
+            await asyncio.sleep(60)
+
+        self.summarizer.summarize_async = summarize_async
+        future = self.batcher.submit('Slow text')
+        self.batcher.close()
+
+        with self.assertRaises(concurrent.futures.CancelledError):
+            future.result(timeout=5)
+
+    def test_identical_concurrent_requests_are_coalesced(self):
+        """Test that identical requests in one batch share a single call"""
+        barrier = threading.Barrier(4)
+        futures = []
+
+        def submit():
+            barrier.wait()
+            futures.append(self.batcher.submit('Same text'))
+
+        threads = [threading.Thread(target=submit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(len(results), 4)
+        for result in results:
+            self.assertEqual(result['summary'], 'Summary of Same text')
+        self.assertEqual(len(self.calls), 1)
+
+    def test_distinct_requests_are_summarized_separately(self):
+        """Test that requests with different parameters are not merged"""
+        first = self.batcher.submit('Text', summary_type='concise')
+        second = self.batcher.submit('Text', summary_type='detailed')
+        first.result(timeout=5)
+        second.result(timeout=5)
+
+        self.assertEqual(len(self.calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,51 +1,83 @@
 """Unit tests for TextSummarizer class"""
 
+import asyncio
+import json
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import os
 import sys
+import threading
+import time
+import aiohttp
+import requests
 
 # Add parent directory to path to import models
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from models.summarizer import TextSummarizer
+from models.summarizer import TextSummarizer, _OpenAIError, _REDUCE_INPUT_LIMIT, _is_transient
+
+
+def json_response(body):
+    """Build a mock successful HTTP response returning body as JSON"""
+    response = MagicMock(status_code=200)
+    response.json.return_value = body
+    return response
+
+
+def completion_body(content):
+    """Build a chat completion response body returning content"""
+    return {'choices': [{'message': {'content': content}}]}
+
+
+def completion_response(content):
+    """Build a mock chat completion HTTP response returning content"""
+    return json_response(completion_body(content))
+
+
+def batch_created_responses(status, **batch):
+    """Build the mock file upload and batch creation responses of a Batch API job"""
+    return [json_response({'id': 'file-in'}), json_response({'id': 'batch-1', 'status': status, **batch})]
+
+
+def batch_output(*results):
+    """Build a mock Batch API result file from (custom_id, status_code, body) records"""
+    response = MagicMock(status_code=200)
+    response.text = '\n'.join(
+        json.dumps({'custom_id': custom_id, 'response': {'status_code': status, 'body': body}})
+        for custom_id, status, body in results
+    )
+    return response
 
 
 class TestTextSummarizer(unittest.TestCase):
     """Test cases for TextSummarizer class"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        # Mock API key for testing
-        os.environ['OPENAI_API_KEY'] = 'test-api-key-12345'
-        
-    def tearDown(self):
-        """Clean up after tests"""
-        if 'OPENAI_API_KEY' in os.environ:
-            del os.environ['OPENAI_API_KEY']
-    
     def test_initialization_with_api_key(self):
         """Test TextSummarizer initialization with API key"""
         summarizer = TextSummarizer(api_key='test-key')
         self.assertIsNotNone(summarizer)
         self.assertEqual(summarizer.api_key, 'test-key')
     
+    @patch('models.summarizer._DEFAULT_API_KEY', None)
     def test_initialization_without_api_key_raises_error(self):
         """Test that missing API key raises ValueError"""
-        if 'OPENAI_API_KEY' in os.environ:
-            del os.environ['OPENAI_API_KEY']
-        
         with self.assertRaises(ValueError) as context:
             TextSummarizer()
         
         self.assertIn('OpenAI API key is required', str(context.exception))
     
+    @patch('models.summarizer._DEFAULT_API_KEY', 'env-test-key')
     def test_initialization_with_environment_variable(self):
-        """Test initialization using environment variable"""
-        os.environ['OPENAI_API_KEY'] = 'env-test-key'
+        """Test initialization using the OPENAI_API_KEY read at import"""
         summarizer = TextSummarizer()
         self.assertEqual(summarizer.api_key, 'env-test-key')
     
+    @patch('models.summarizer._DEFAULT_MODEL', 'gpt-4')
+    def test_initialization_with_model_from_environment(self):
+        """Test that the model defaults to the OPENAI_MODEL read at import"""
+        self.assertEqual(TextSummarizer(api_key='test-key').model, 'gpt-4')
+        self.assertEqual(TextSummarizer(api_key='test-key', model='gpt-4o').model, 'gpt-4o')
+    
     def test_summarize_empty_text_raises_error(self):
         """Test that empty text raises ValueError"""
         summarizer = TextSummarizer(api_key='test-key')
@@ -55,14 +87,11 @@ class TestTextSummarizer(unittest.TestCase):
         
         self.assertIn('Text cannot be empty', str(context.exception))
     
-    @patch('models.summarizer.openai.ChatCompletion.create')
-    def test_summarize_short_text(self, mock_create):
+    @patch('requests.Session.post')
+    def test_summarize_short_text(self, mock_post):
         """Test summarization of short text"""
         # Mock OpenAI API response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message = {'content': 'This is a test summary.'}
-        mock_create.return_value = mock_response
+        mock_post.return_value = completion_response('This is a test summary.')
         
         summarizer = TextSummarizer(api_key='test-key')
         result = summarizer.summarize('This is a short test text.')
@@ -73,28 +102,43 @@ class TestTextSummarizer(unittest.TestCase):
         self.assertIn('compression_ratio', result)
         self.assertEqual(result['summary'], 'This is a test summary.')
     
-    @patch('models.summarizer.openai.ChatCompletion.create')
-    def test_summarize_with_max_length(self, mock_create):
+    def test_build_result_statistics(self):
+        """Test the statistics reported alongside a summary"""
+        result = TextSummarizer._build_result('x' * 100, '\u2022 First  point.\n\u2022 Second point.')
+        
+        self.assertEqual(result['original_length'], 100)
+        self.assertEqual(result['summary_length'], 31)
+        self.assertEqual(result['compression_ratio'], 0.31)
+        self.assertEqual(result['word_count'], 6)
+    
+    @patch('models.summarizer.TextSummarizer._summarize_long')
+    @patch('requests.Session.post')
+    def test_summarize_borderline_text_uses_single_call(self, mock_post, mock_long):
+        """Test that text just over 1000 characters is not chunked"""
+        mock_post.return_value = completion_response('Summary.')
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        summarizer.summarize('word ' * 300)
+        
+        self.assertEqual(mock_post.call_count, 1)
+        mock_long.assert_not_called()
+    
+    @patch('requests.Session.post')
+    def test_summarize_with_max_length(self, mock_post):
         """Test summarization with custom max_length"""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message = {'content': 'Short summary.'}
-        mock_create.return_value = mock_response
+        mock_post.return_value = completion_response('Short summary.')
         
         summarizer = TextSummarizer(api_key='test-key')
         result = summarizer.summarize('Test text.', max_length=50)
         
         # Verify max_length was passed (check mock was called with appropriate params)
-        self.assertTrue(mock_create.called)
+        self.assertTrue(mock_post.called)
         self.assertIn('summary', result)
     
-    @patch('models.summarizer.openai.ChatCompletion.create')
-    def test_summarize_concise_type(self, mock_create):
+    @patch('requests.Session.post')
+    def test_summarize_concise_type(self, mock_post):
         """Test concise summary type"""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message = {'content': 'Concise summary.'}
-        mock_create.return_value = mock_response
+        mock_post.return_value = completion_response('Concise summary.')
         
         summarizer = TextSummarizer(api_key='test-key')
         result = summarizer.summarize('Test text.', summary_type='concise')
@@ -102,6 +146,261 @@ class TestTextSummarizer(unittest.TestCase):
         self.assertIn('summary', result)
         self.assertEqual(result['summary'], 'Concise summary.')
     
+    @patch('requests.Session.post')
+    def test_summarize_passes_instance_api_key(self, mock_post):
+        """Test that each call uses the instance's API key rather than global state"""
+        mock_post.return_value = completion_response('Summary.')
+        
+        summarizer = TextSummarizer(api_key='instance-key')
+        summarizer.summarize('Test text.')
+        
+        self.assertEqual(mock_post.call_args.kwargs['headers']['Authorization'], 'Bearer instance-key')
+    
+    @patch.object(TextSummarizer._chat_completion.retry, 'sleep')
+    @patch('requests.Session.post')
+    def test_summarize_rate_limited_raises_error(self, mock_post, mock_sleep):
+        """Test that a persistent 429 is retried, then surfaces as ValueError"""
+        mock_post.return_value = MagicMock(status_code=429, text='Rate limit reached')
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        with self.assertRaises(ValueError) as context:
+            summarizer.summarize('Test text.')
+        
+        self.assertIn('rate limit exceeded', str(context.exception))
+        self.assertEqual(mock_post.call_count, 6)
+    
+    @patch.object(TextSummarizer._chat_completion.retry, 'sleep')
+    @patch('requests.Session.post')
+    def test_summarize_retries_transient_errors(self, mock_post, mock_sleep):
+        """Test that rate limits and server errors are retried with backoff"""
+        mock_post.side_effect = [
+            MagicMock(status_code=429, text='Rate limit reached'),
+            MagicMock(status_code=503, text='Service unavailable'),
+            completion_response('Summary after retry.')
+        ]
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        result = summarizer.summarize('Test text.')
+        
+        self.assertEqual(result['summary'], 'Summary after retry.')
+        self.assertEqual(mock_sleep.call_count, 2)
+    
+    def test_is_transient_classifies_errors(self):
+        """Test that only rate limits, server errors and network failures are retried"""
+        for error in (_OpenAIError(429, 'Rate limit reached'), _OpenAIError(502, 'Bad gateway'),
+                      asyncio.TimeoutError(), aiohttp.ServerDisconnectedError(),
+                      aiohttp.ClientPayloadError(), requests.ConnectionError(), requests.Timeout()):
+            self.assertTrue(_is_transient(error), error)
+        
+        for error in (_OpenAIError(400, 'Bad request'), requests.exceptions.InvalidURL(),
+                      requests.JSONDecodeError('Expecting value', '', 0), ValueError()):
+            self.assertFalse(_is_transient(error), error)
+    
+    @patch('models.summarizer._OPENAI_SLOTS', new_callable=lambda: threading.BoundedSemaphore(2))
+    @patch('requests.Session.post')
+    def test_concurrent_sync_calls_share_the_process_cap(self, mock_post, mock_slots):
+        """Test that synchronous calls from many threads respect the concurrency cap"""
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+        
+        def post(*args, **kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.pop()
+            return completion_response('Summary.')
+        mock_post.side_effect = post
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        threads = [threading.Thread(target=summarizer.summarize, args=(f'Text {i}.',)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(mock_post.call_count, 6)
+        self.assertEqual(max(peak), 2)
+    
+    @patch('requests.Session.post')
+    def test_summarize_does_not_retry_invalid_api_key(self, mock_post):
+        """Test that authentication errors fail immediately"""
+        mock_post.return_value = MagicMock(status_code=401, text='Incorrect API key provided')
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        with self.assertRaises(ValueError):
+            summarizer.summarize('Test text.')
+        
+        self.assertEqual(mock_post.call_count, 1)
+    
+    @patch('requests.Session.post')
+    def test_summarize_repeated_input_uses_cache(self, mock_post):
+        """Test that resubmitting the same input does not call the API again"""
+        mock_post.return_value = completion_response('Cached summary.')
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        first = summarizer.summarize('Repeated text.')
+        second = summarizer.summarize('Repeated text.')
+        summarizer.summarize('Repeated text.', summary_type='detailed')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_post.call_count, 2)
+    
+    @patch('requests.Session.post')
+    def test_summarize_cache_evicts_least_recently_used(self, mock_post):
+        """Test that the cache is bounded by cache_size"""
+        mock_post.return_value = completion_response('Summary.')
+        
+        summarizer = TextSummarizer(api_key='test-key', cache_size=1)
+        summarizer.summarize('First text.')
+        summarizer.summarize('Second text.')
+        summarizer.summarize('First text.')
+        
+        self.assertEqual(mock_post.call_count, 3)
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_async_short_text(self, mock_completion):
+        """Test async summarization of short text"""
+        mock_completion.return_value = 'Async summary.'
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        result = asyncio.run(summarizer.summarize_async('This is a short test text.'))
+        
+        self.assertEqual(result['summary'], 'Async summary.')
+        self.assertEqual(result['original_length'], len('This is a short test text.'))
+        mock_completion.assert_awaited_once()
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_async_invalid_api_key(self, mock_completion):
+        """Test that a 401 from the API surfaces as ValueError"""
+        mock_completion.side_effect = _OpenAIError(401, 'Incorrect API key provided')
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(summarizer.summarize_async('Test text.'))
+        
+        self.assertIn('Invalid OpenAI API key', str(context.exception))
+    
+    def test_summarize_async_empty_text_raises_error(self):
+        """Test that empty text raises ValueError in the async path"""
+        summarizer = TextSummarizer(api_key='test-key')
+        
+        with self.assertRaises(ValueError):
+            asyncio.run(summarizer.summarize_async('   '))
+    
+    @patch('requests.Session.post')
+    def test_summarize_stream(self, mock_post):
+        """Test that streamed deltas are followed by a final stats event"""
+        lines = [
+            json.dumps({'choices': [{'delta': {'role': 'assistant'}}]}),
+            json.dumps({'choices': [{'delta': {'content': 'Streamed '}}]}),
+            json.dumps({'choices': [{'delta': {'content': 'summary.'}}]})
+        ]
+        mock_post.return_value = MagicMock(status_code=200)
+        mock_post.return_value.iter_lines.return_value = (
+            [b'data: ' + line.encode('utf-8') for line in lines] + [b'', b'data: [DONE]']
+        )
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        events = list(summarizer.summarize_stream('This is a short test text.'))
+        
+        self.assertEqual(events[:2], [{'delta': 'Streamed '}, {'delta': 'summary.'}])
+        self.assertTrue(events[-1]['done'])
+        self.assertEqual(events[-1]['summary'], 'Streamed summary.')
+        self.assertEqual(events[-1]['word_count'], 2)
+        self.assertTrue(mock_post.call_args.kwargs['json']['stream'])
+    
+    @patch('models.summarizer._OPENAI_SLOTS', new_callable=lambda: threading.BoundedSemaphore(1))
+    @patch('requests.Session.post')
+    def test_summarize_stream_holds_slot_until_stream_ends(self, mock_post, mock_slots):
+        """Test that a streamed response counts against the concurrency cap while it streams"""
+        lines = [json.dumps({'choices': [{'delta': {'content': word}}]}) for word in ('One ', 'two.')]
+        mock_post.return_value = MagicMock(status_code=200)
+        mock_post.return_value.iter_lines.return_value = [b'data: ' + line.encode('utf-8') for line in lines]
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        events = summarizer.summarize_stream('This is a short test text.')
+        self.assertEqual(next(events), {'delta': 'One '})
+        self.assertFalse(mock_slots.acquire(blocking=False))
+        
+        events.close()
+        self.assertTrue(mock_slots.acquire(blocking=False))
+    
+    def test_summarize_stream_empty_text_raises_error(self):
+        """Test that empty text is rejected before streaming starts"""
+        summarizer = TextSummarizer(api_key='test-key')
+        
+        with self.assertRaises(ValueError):
+            summarizer.summarize_stream('')
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_long_text_maps_chunks_concurrently(self, mock_completion):
+        """Test that long text is summarized per chunk and then combined"""
+        in_flight = []
+        peak = []
+        
+        async def complete(prompt, max_tokens):
+            in_flight.append(prompt)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt)
+            return 'Partial summary.'
+        mock_completion.side_effect = complete
+        
+        text = ' '.join(f'Sentence number {i} of the study notes.' for i in range(300))
+        summarizer = TextSummarizer(api_key='test-key')
+        result = summarizer.summarize(text)
+        
+        chunk_count = len(TextSummarizer._fast_split(text))
+        self.assertEqual(mock_completion.await_count, chunk_count + 1)
+        self.assertGreater(max(peak), 1)
+        # The reduce step summarizes the joined partial summaries
+        reduce_prompt = mock_completion.await_args_list[-1].args[0]
+        self.assertIn('Partial summary.\n\nPartial summary.', reduce_prompt)
+        self.assertEqual(result['summary'], 'Partial summary.')
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_long_text_reduces_in_rounds(self, mock_completion):
+        """Test that partial summaries too large for one call are reduced in rounds"""
+        mock_completion.return_value = 'Partial summary. ' * 60
+        
+        text = ' '.join(f'Sentence number {i} of the study notes.' for i in range(3000))
+        summarizer = TextSummarizer(api_key='test-key')
+        summarizer.summarize(text)
+        
+        chunk_count = len(TextSummarizer._fast_split(text))
+        self.assertGreater(mock_completion.await_count, chunk_count + 1)
+        for call in mock_completion.await_args_list:
+            self.assertLess(len(call.args[0]), _REDUCE_INPUT_LIMIT + 1000)
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_long_text_inside_running_event_loop(self, mock_completion):
+        """Test that the sync API summarizes long text from a thread running an event loop"""
+        mock_completion.return_value = 'Partial summary.'
+        
+        text = ' '.join(f'Sentence number {i} of the study notes.' for i in range(300))
+        summarizer = TextSummarizer(api_key='test-key')
+        
+        async def summarize_from_loop():
+            return summarizer.summarize(text)
+        
+        result = asyncio.run(summarize_from_loop())
+        
+        self.assertEqual(result['summary'], 'Partial summary.')
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_summarize_long_text_bullet_points_are_formatted(self, mock_completion):
+        """Test that long bullet point summaries are formatted as bullets"""
+        mock_completion.return_value = 'First point. Second point.'
+        
+        text = ' '.join(f'Sentence number {i} of the study notes.' for i in range(300))
+        summarizer = TextSummarizer(api_key='test-key')
+        result = summarizer.summarize(text, summary_type='bullet_points')
+        
+        self.assertEqual(result['summary'], '\u2022 First point.\n\u2022 Second point.')
+    
     def test_build_prompt_concise(self):
         """Test prompt building for concise summary"""
         summarizer = TextSummarizer(api_key='test-key')
@@ -127,6 +426,35 @@ class TestTextSummarizer(unittest.TestCase):
         self.assertIn('bullet point', prompt)
         self.assertIn('150', prompt)
     
+    def test_fast_split_covers_text_with_overlap(self):
+        """Test that long text is split into bounded, overlapping chunks"""
+        text = ' '.join(f'Sentence number {i} of the study notes.' for i in range(300))
+        chunks = TextSummarizer._fast_split(text)
+        
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 2002)
+        # Every chunk after the first starts with the previous chunk's tail
+        self.assertTrue(chunks[0].endswith(chunks[1][:200]))
+        self.assertIn('Sentence number 299 of the study notes.', chunks[-1])
+    
+    def test_fast_split_hard_cuts_text_without_boundaries(self):
+        """Test that text without sentence breaks is still fully covered"""
+        text = 'x' * 5000
+        chunks = TextSummarizer._fast_split(text)
+        
+        self.assertEqual(''.join(chunk[200:] if i else chunk for i, chunk in enumerate(chunks)), text)
+    
+    def test_build_prompt_unknown_type_uses_concise(self):
+        """Test that an unknown summary type falls back to the concise prompt"""
+        summarizer = TextSummarizer(api_key='test-key')
+        
+        self.assertEqual(
+            summarizer._build_prompt('Test {text}', 'unknown', 100),
+            summarizer._build_prompt('Test {text}', 'concise', 100)
+        )
+        self.assertIn('Test {text}', summarizer._build_prompt('Test {text}', 'concise', 100))
+    
     def test_format_as_bullets(self):
         """Test formatting text as bullet points"""
         summarizer = TextSummarizer(api_key='test-key')
@@ -137,6 +465,13 @@ class TestTextSummarizer(unittest.TestCase):
         lines = result.split('\n')
         self.assertEqual(len(lines), 3)
     
+    def test_format_as_bullets_splits_on_sentence_punctuation(self):
+        """Test that questions and exclamations also end a bullet"""
+        summarizer = TextSummarizer(api_key='test-key')
+        result = summarizer._format_as_bullets('Is it true? It is!  Done')
+        
+        self.assertEqual(result, '\u2022 Is it true?\n\u2022 It is!\n\u2022 Done.')
+    
     def test_format_as_bullets_already_formatted(self):
         """Test that already formatted bullet points are not reformatted"""
         summarizer = TextSummarizer(api_key='test-key')
@@ -145,13 +480,10 @@ class TestTextSummarizer(unittest.TestCase):
         
         self.assertEqual(text, result)
     
-    @patch('models.summarizer.openai.ChatCompletion.create')
-    def test_batch_summarize(self, mock_create):
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_batch_summarize(self, mock_completion):
         """Test batch summarization of multiple texts"""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message = {'content': 'Summary.'}
-        mock_create.return_value = mock_response
+        mock_completion.return_value = 'Summary.'
         
         summarizer = TextSummarizer(api_key='test-key')
         texts = ['Text one.', 'Text two.', 'Text three.']
@@ -161,8 +493,11 @@ class TestTextSummarizer(unittest.TestCase):
         for result in results:
             self.assertIn('summary', result)
     
-    def test_batch_summarize_with_errors(self):
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_batch_summarize_with_errors(self, mock_completion):
         """Test batch summarization handles errors gracefully"""
+        mock_completion.return_value = 'Summary.'
+        
         summarizer = TextSummarizer(api_key='test-key')
         texts = ['', 'Valid text', '']
         results = summarizer.batch_summarize(texts)
@@ -171,6 +506,151 @@ class TestTextSummarizer(unittest.TestCase):
         # First and third should have errors
         self.assertIn('error', results[0])
         self.assertIn('error', results[2])
+        self.assertEqual(results[1]['summary'], 'Summary.')
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_batch_summarize_preserves_order(self, mock_completion):
+        """Test that concurrent batch results come back in input order"""
+        async def complete(prompt, max_tokens):
+            # Finish later texts first to exercise reordering
+            await asyncio.sleep(0.01 if 'first' in prompt else 0)
+            return 'first summary' if 'first' in prompt else 'second summary'
+        mock_completion.side_effect = complete
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        results = summarizer.batch_summarize(['The first text.', 'The second text.'])
+        
+        self.assertEqual(results[0]['summary'], 'first summary')
+        self.assertEqual(results[1]['summary'], 'second summary')
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    def test_batch_summarize_respects_max_concurrency(self, mock_completion):
+        """Test that no more than max_concurrency calls run at once"""
+        in_flight = []
+        peak = []
+        
+        async def complete(prompt, max_tokens):
+            in_flight.append(prompt)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt)
+            return 'Summary.'
+        mock_completion.side_effect = complete
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        texts = [f'Text number {i}.' for i in range(6)]
+        results = summarizer.batch_summarize(texts, max_concurrency=2)
+        
+        self.assertEqual(len(results), 6)
+        self.assertLessEqual(max(peak), 2)
+
+    @patch('models.summarizer._http_session')
+    def test_batch_summarize_with_batch_api(self, mock_session):
+        """Test that the Batch API results are returned in input order"""
+        mock_http = mock_session.return_value
+        mock_http.post.side_effect = batch_created_responses('completed', output_file_id='file-out')
+        mock_http.get.return_value = batch_output(
+            ('1', 200, completion_body('Second.')),
+            ('0', 200, completion_body('First.'))
+        )
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        results = summarizer.batch_summarize(['Text one.', 'Text two.', ''], use_batch_api=True)
+        
+        self.assertEqual(results[0]['summary'], 'First.')
+        self.assertEqual(results[1]['summary'], 'Second.')
+        self.assertIn('error', results[2])
+        batch_request = mock_http.post.call_args_list[1].kwargs['json']
+        self.assertEqual(batch_request['endpoint'], '/v1/chat/completions')
+    
+    @patch.object(TextSummarizer._openai_get.retry, 'sleep')
+    @patch('models.summarizer.time.sleep')
+    @patch('models.summarizer._http_session')
+    def test_batch_api_poll_retries_transient_errors(self, mock_session, mock_poll_sleep, mock_retry_sleep):
+        """Test that a transient error while polling does not abandon the job"""
+        mock_http = mock_session.return_value
+        mock_http.post.side_effect = batch_created_responses('in_progress')
+        mock_http.get.side_effect = [
+            MagicMock(status_code=503, text='Unavailable'),
+            json_response({'id': 'batch-1', 'status': 'completed', 'output_file_id': 'file-out'}),
+            batch_output(('0', 200, completion_body('First.')))
+        ]
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        results = summarizer.batch_summarize(['Text one.'], use_batch_api=True)
+        
+        self.assertEqual(results[0]['summary'], 'First.')
+        self.assertEqual(mock_retry_sleep.call_count, 1)
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    @patch('models.summarizer.time.sleep')
+    @patch('models.summarizer._http_session')
+    def test_batch_api_poll_failure_cancels_and_falls_back(self, mock_session, mock_poll_sleep, mock_completion):
+        """Test that a failed poll cancels the job and uses concurrent calls"""
+        mock_http = mock_session.return_value
+        mock_http.post.side_effect = batch_created_responses('in_progress') + [MagicMock(status_code=200)]
+        mock_http.get.return_value = MagicMock(status_code=404, text='Not found')
+        mock_completion.return_value = 'Fallback summary.'
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        results = summarizer.batch_summarize(['Text one.'], use_batch_api=True)
+        
+        self.assertEqual(results[0]['summary'], 'Fallback summary.')
+        self.assertTrue(mock_http.post.call_args.args[0].endswith('/batches/batch-1/cancel'))
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    @patch('models.summarizer._http_session')
+    def test_batch_api_failed_job_falls_back(self, mock_session, mock_completion):
+        """Test that a job ending in a failed state is retried concurrently"""
+        mock_http = mock_session.return_value
+        mock_http.post.side_effect = batch_created_responses('failed')
+        mock_completion.return_value = 'Fallback summary.'
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        results = summarizer.batch_summarize(['Text one.', 'Text two.'], use_batch_api=True)
+        
+        self.assertEqual([result['summary'] for result in results], ['Fallback summary.'] * 2)
+        mock_http.get.assert_not_called()
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    @patch('models.summarizer._http_session')
+    def test_batch_api_transient_and_missing_results_fall_back(self, mock_session, mock_completion):
+        """Test that rate limited or missing batch results are retried concurrently"""
+        mock_http = mock_session.return_value
+        mock_http.post.side_effect = batch_created_responses(
+            'completed', output_file_id='file-out', error_file_id='file-err'
+        )
+        mock_http.get.side_effect = [
+            batch_output(('0', 200, completion_body('First.'))),
+            batch_output(
+                ('1', 429, {'error': {'message': 'Rate limit reached'}}),
+                ('2', 400, {'error': {'message': 'Invalid request'}})
+            )
+        ]
+        mock_completion.return_value = 'Fallback summary.'
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        results = summarizer.batch_summarize(['Text one.', 'Text two.', 'Text three.', 'Text four.'],
+                                             use_batch_api=True)
+        
+        self.assertEqual(results[0]['summary'], 'First.')
+        self.assertEqual(results[1]['summary'], 'Fallback summary.')
+        self.assertIn('error', results[2])
+        self.assertEqual(results[3]['summary'], 'Fallback summary.')
+        self.assertEqual(mock_completion.await_count, 2)
+    
+    @patch('models.summarizer.TextSummarizer._chat_completion_async', new_callable=AsyncMock)
+    @patch('models.summarizer.TextSummarizer._submit_openai_batch')
+    def test_batch_api_timeout_falls_back_to_concurrent_calls(self, mock_submit, mock_completion):
+        """Test that a Batch API job that times out is retried concurrently"""
+        mock_submit.side_effect = TimeoutError('too slow')
+        mock_completion.return_value = 'Fallback summary.'
+        
+        summarizer = TextSummarizer(api_key='test-key')
+        results = summarizer.batch_summarize(['Text one.', 'Text two.'], use_batch_api=True, batch_timeout=1)
+        
+        self.assertEqual([result['summary'] for result in results], ['Fallback summary.'] * 2)
+        self.assertEqual(mock_completion.await_count, 2)
 
 
 if __name__ == '__main__':